@@ -0,0 +1,92 @@
+# deployment/benchmark.py
+"""Benchmark batch scoring: predict_df biasa vs predict_df_dedup.
+
+Jalankan dari root repo:  python deployment/benchmark.py [--sizes 1000 10000 39221]
+"""
+import argparse
+import json
+import time
+
+import pandas as pd
+
+# dukung `python deployment/benchmark.py` maupun `python -m deployment.benchmark` (keduanya dari root repo)
+try:
+    from deployment.prediction import (
+        load_artifacts, ensure_features, predict_df, predict_df_dedup, dedup_ratio, should_dedup,
+        load_scoring_frame,
+    )
+except ImportError:
+    from prediction import (
+        load_artifacts, ensure_features, predict_df, predict_df_dedup, dedup_ratio, should_dedup,
+        load_scoring_frame,
+    )
+
+# skenario data: fitur apa adanya vs dibulatkan 2 desimal (presisi form Streamlit)
+SCENARIOS = {"raw": None, "rounded_2dp": 2}
+
+
+def _best_of(fn, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def _speedup(t_base: float, t: float) -> float:
+    return round(t_base / t, 3) if t else float("nan")
+
+
+def bench_dedup(sizes, repeats: int = 3, seed: int = 42, scenarios=("raw",)) -> list:
+    """Ukur dedup ratio & speedup per skenario dan ukuran batch.
+
+    Selain mode otomatis, jalur dedup dan fallback juga diukur secara paksa supaya
+    overhead masing-masing terlihat. Semua output dicek identik dengan `predict_df`.
+    """
+    pipeline, meta, threshold = load_artifacts()
+    force_dedup = dict(min_dup_ratio=0.0, min_rows=0)
+    force_fallback = dict(min_dup_ratio=float("inf"))
+    rows = []
+    for scenario in scenarios:
+        frame = load_scoring_frame(decimals=SCENARIOS[scenario])
+        for size in sizes:
+            batch = frame.sample(n=size, replace=size > len(frame), random_state=seed).reset_index(drop=True)
+            base = predict_df(batch, pipeline, meta, threshold)
+            for kw in ({}, force_dedup, force_fallback):
+                pd.testing.assert_frame_equal(base, predict_df_dedup(batch, pipeline, meta, threshold, **kw))
+
+            engineered = ensure_features(batch, meta)
+            n_unique = int(len(engineered.drop_duplicates()))
+            t_base = _best_of(lambda: predict_df(batch, pipeline, meta, threshold), repeats)
+            t_auto = _best_of(lambda: predict_df_dedup(batch, pipeline, meta, threshold), repeats)
+            t_dedup = _best_of(lambda: predict_df_dedup(batch, pipeline, meta, threshold, **force_dedup), repeats)
+            t_fallback = _best_of(lambda: predict_df_dedup(batch, pipeline, meta, threshold, **force_fallback), repeats)
+            rows.append({
+                "scenario": scenario,
+                "batch_size": int(size),
+                "unique_rows": n_unique,
+                "dedup_ratio": round(dedup_ratio(size, n_unique), 4),
+                "auto_path": "dedup" if should_dedup(engineered) else "fallback",
+                "baseline_s": round(t_base, 6),
+                "auto_s": round(t_auto, 6),
+                "dedup_s": round(t_dedup, 6),
+                "fallback_s": round(t_fallback, 6),
+                "auto_speedup": _speedup(t_base, t_auto),
+                "dedup_speedup": _speedup(t_base, t_dedup),
+                "fallback_speedup": _speedup(t_base, t_fallback),
+            })
+    return rows
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000, 39221])
+    ap.add_argument("--repeats", type=int, default=3)
+    ap.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS))
+    args = ap.parse_args()
+    print(json.dumps(bench_dedup(args.sizes, args.repeats, scenarios=args.scenarios), indent=2))
+
+
+if __name__ == "__main__":
+    main()
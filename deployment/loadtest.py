@@ -0,0 +1,199 @@
+# deployment/loadtest.py
+"""Load test open-loop (Poisson) untuk jalur scoring in-process.
+
+Jalankan dari root repo:
+    python deployment/loadtest.py --rates 10 25 50 100 --duration 20 --pool thread --workers 4 --out loadtest.json
+"""
+import argparse
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait
+
+import numpy as np
+import pandas as pd
+
+# dukung `python deployment/loadtest.py` maupun `python -m deployment.loadtest` (keduanya dari root repo)
+try:
+    from deployment.prediction import load_artifacts, predict_df, load_scoring_frame
+except ImportError:
+    from prediction import load_artifacts, predict_df, load_scoring_frame
+
+PERCENTILES = {"p50": 50, "p95": 95, "p99": 99, "p99_9": 99.9}
+
+# artefak per proses worker (di-set oleh _init_worker)
+_ARTIFACTS = None
+
+
+def _init_worker():
+    global _ARTIFACTS
+    _ARTIFACTS = load_artifacts()
+
+
+def _score_one(record: dict) -> float:
+    """Skor satu transaksi seperti halaman prediksi (DataFrame 1 baris)."""
+    pipeline, meta, threshold = _ARTIFACTS
+    res = predict_df(pd.DataFrame([record]), pipeline, meta, threshold)
+    return float(res["fraud_proba"].iloc[0])
+
+
+def _make_executor(pool: str, workers: int):
+    if pool == "process":
+        return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+    _init_worker()
+    return ThreadPoolExecutor(max_workers=workers)
+
+
+def run_step(executor, records, rate: float, duration: float, drain_timeout: float, rng) -> dict:
+    """Satu langkah beban: kedatangan Poisson `rate` req/s selama `duration` detik.
+
+    Open-loop: jadwal kedatangan dibuat di depan dan tidak menunggu respons sebelumnya.
+    Latensi diukur dari waktu kedatangan terjadwal sampai selesai, jadi waktu antre ikut terhitung.
+    """
+    gaps = rng.exponential(1.0 / rate, size=int(rate * duration * 1.5) + 10)
+    offsets = np.cumsum(gaps)
+    offsets = offsets[offsets < duration]
+    picks = rng.integers(0, len(records), size=len(offsets))
+
+    done, errors = [], []
+    n_cancelled = 0
+    cond = threading.Condition()
+    futures = []
+    n_callbacks = 0
+
+    def _on_done(fut, scheduled):
+        nonlocal n_callbacks, n_cancelled
+        done_at = time.perf_counter()
+        with cond:
+            n_callbacks += 1
+            cond.notify_all()
+            if fut.cancelled():
+                n_cancelled += 1
+                return
+            if fut.exception() is not None:
+                errors.append(repr(fut.exception()))
+            else:
+                done.append((done_at, done_at - scheduled))
+
+    start = time.perf_counter()
+    for off, idx in zip(offsets, picks):
+        scheduled = start + off
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        fut = executor.submit(_score_one, records[idx])
+        fut.add_done_callback(lambda f, s=scheduled: _on_done(f, s))
+        futures.append(fut)
+
+    _, pending = wait(futures, timeout=max(0.0, start + duration + drain_timeout - time.perf_counter()))
+    deadline = time.perf_counter()
+    cancelled = sum(fut.cancel() for fut in pending)
+    # request yang sudah jalan / sudah di antrean proses tidak bisa di-cancel:
+    # tunggu sampai executor idle supaya tidak bocor ke langkah berikutnya
+    wait(futures)
+    idle_at = time.perf_counter()
+
+    with cond:
+        # callback bisa jalan sesaat setelah wait() kembali
+        cond.wait_for(lambda: n_callbacks == len(futures))
+        n_in_time = sum(1 for t, _ in done if t <= deadline)
+        lat_ms = np.asarray([lat for _, lat in done]) * 1000.0
+        # request yang di-cancel tidak punya latensi nyata: hitung sebagai tak hingga
+        all_ms = np.concatenate([lat_ms, np.full(n_cancelled, np.inf)])
+        n_err = len(errors)
+        first_err = errors[0] if errors else None
+    elapsed = max(deadline - start, duration)
+    step = {
+        "offered_rps": float(rate),
+        "sent": len(futures),
+        "sent_rps": round(len(futures) / duration, 3),
+        "completed": int(lat_ms.size),
+        "errors": n_err,
+        "timed_out": len(pending),
+        "cancelled": int(cancelled),
+        "carried_over": len(pending) - int(cancelled),
+        "elapsed_s": round(elapsed, 3),
+        "idle_wait_s": round(idle_at - deadline, 3),
+        "throughput_rps": round(n_in_time / elapsed, 3),
+    }
+    # persentil yang jatuh di request yang di-cancel tidak terukur -> None
+    for name, q in PERCENTILES.items():
+        val = float(np.percentile(all_ms, q, method="higher")) if all_ms.size else np.inf
+        step[f"{name}_ms"] = round(val, 3) if np.isfinite(val) else None
+    if first_err:
+        step["first_error"] = first_err
+    return step
+
+
+def _is_saturated(step: dict, sla_ms: float, min_efficiency: float) -> bool:
+    """Jenuh jika p99 melewati SLA, ada request yang tidak selesai, atau throughput tertinggal dari beban terkirim."""
+    if step["timed_out"] or step["errors"] or step["p99_ms"] is None:
+        return True
+    if step["p99_ms"] > sla_ms:
+        return True
+    return step["throughput_rps"] < min_efficiency * step["sent_rps"]
+
+
+def run_load_test(rates, duration=20.0, pool="thread", workers=4, sla_ms=200.0,
+                  min_efficiency=0.95, drain_timeout=10.0, warmup=20, seed=42, stop_on_saturation=True) -> dict:
+    """Naikkan rate bertahap dan laporkan throughput, persentil latensi & titik jenuh."""
+    records = load_scoring_frame().to_dict("records")
+    rng = np.random.default_rng(seed)
+
+    steps, saturation_rps, max_sustained_rps = [], None, None
+    with _make_executor(pool, workers) as executor:
+        # pemanasan: load model di tiap worker sebelum pengukuran
+        warm = [executor.submit(_score_one, records[i % len(records)]) for i in range(max(warmup, workers))]
+        for fut in warm:
+            fut.result()  # gagal load model / scoring -> hentikan test, jangan dilaporkan sebagai jenuh
+        for rate in sorted(rates):
+            step = run_step(executor, records, rate, duration, drain_timeout, rng)
+            step["saturated"] = _is_saturated(step, sla_ms, min_efficiency)
+            steps.append(step)
+            if step["saturated"]:
+                saturation_rps = saturation_rps or float(rate)
+                if stop_on_saturation:
+                    break
+            elif saturation_rps is None:
+                max_sustained_rps = float(rate)
+
+    return {
+        "config": {
+            "pool": pool, "workers": workers, "duration_s": duration, "sla_p99_ms": sla_ms,
+            "min_efficiency": min_efficiency, "drain_timeout_s": drain_timeout, "seed": seed,
+        },
+        "steps": steps,
+        "max_sustained_rps": max_sustained_rps,
+        "saturation_rps": saturation_rps,
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--rates", type=float, nargs="+", default=[5, 10, 25, 50, 100, 200])
+    ap.add_argument("--duration", type=float, default=20.0, help="detik per langkah rate")
+    ap.add_argument("--pool", choices=["thread", "process"], default="thread")
+    ap.add_argument("--workers", type=int, default=4)
+    ap.add_argument("--sla-ms", type=float, default=200.0, help="batas p99 latensi (ms)")
+    ap.add_argument("--min-efficiency", type=float, default=0.95, help="throughput minimum / rate yang benar-benar terkirim")
+    ap.add_argument("--drain-timeout", type=float, default=10.0)
+    ap.add_argument("--seed", type=int, default=42)
+    ap.add_argument("--all-steps", action="store_true", help="tetap lanjut setelah titik jenuh")
+    ap.add_argument("--out", default=None, help="path file JSON (default: stdout)")
+    args = ap.parse_args()
+
+    report = run_load_test(
+        args.rates, duration=args.duration, pool=args.pool, workers=args.workers, sla_ms=args.sla_ms,
+        min_efficiency=args.min_efficiency, drain_timeout=args.drain_timeout, seed=args.seed,
+        stop_on_saturation=not args.all_steps,
+    )
+    text = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -30,6 +30,9 @@ THRESHOLD_CANDIDATES = [
 # Fallback mapping dari notebook kamu
 DEFAULT_CATEGORY_PROB = {"shopping": 0.344749, "electronics": 0.328588, "food": 0.329321}
 
+# Dataset mentah (dipakai benchmark & load test)
+DATA_PATH = Path("payment_fraud.csv")
+
 
 def _find_first(paths):
     for p in paths:
@@ -151,11 +154,47 @@ def ensure_features(raw_df: pd.DataFrame, meta: Dict[str, Any]) -> pd.DataFrame:
     return df
 
 
-def predict_df(df: pd.DataFrame, pipeline, meta: Dict[str, Any], threshold: float) -> pd.DataFrame:
-    """Prediksi proba & label dengan threshold."""
-    if "label" in df.columns:
-        df = df.drop(columns=["label"])
-    df = ensure_features(df, meta)
+def load_scoring_frame(path=DATA_PATH, decimals=None) -> pd.DataFrame:
+    """Bentuk input form prediksi dari kolom mentah `payment_fraud.csv`.
+
+    CSV hanya berisi kolom asli Kaggle, jadi fitur yang dibentuk di notebook didekati di sini.
+    Default tanpa pembulatan; `decimals` membulatkan nilai kontinu (skenario terpisah).
+    """
+    raw = pd.read_csv(path)
+    pm = raw["paymentMethod"].astype(str).str.strip().str.lower()
+    cat = raw["Category"].astype("string").str.strip().str.lower()
+    cat = cat.fillna(cat.dropna().mode().iat[0]).astype(str)
+    acc_age = raw["accountAgeDays"].astype(float)
+    pm_age = raw["paymentMethodAgeDays"].astype(float)
+
+    lt = raw["localTime"].astype(float)
+    hour = ((lt - lt.min()) / (lt.max() - lt.min()) * 23).round().astype(int)
+    risk = ((acc_age <= 1).astype(int) + (pm_age <= 1).astype(int) + (pm == "paypal").astype(int)) / 3
+
+    cont = pd.DataFrame({
+        "localTime": lt,
+        "risk_score": risk,
+        "transaction_velocity": raw["numItems"] / (acc_age + 1),
+        "payment_age_ratio": (pm_age / (acc_age + 1)).clip(0, 1),
+    })
+    if decimals is not None:
+        cont = cont.round(int(decimals))
+
+    return pd.DataFrame({
+        "paymentMethod": pm,
+        "Category": cat,
+        "numItems": raw["numItems"].astype(int),
+        "localTime": cont["localTime"],
+        "hour": hour,
+        "risk_score": cont["risk_score"],
+        "transaction_velocity": cont["transaction_velocity"],
+        "payment_age_ratio": cont["payment_age_ratio"],
+        "temporal_risk_window": raw["isWeekend"].fillna(0).astype(int),
+    })
+
+
+def _score_engineered(df: pd.DataFrame, pipeline, threshold: float) -> pd.DataFrame:
+    """Align kategori & skor frame yang sudah melewati `ensure_features`."""
     df = _align_categories_to_training(df, pipeline)
 
     proba = pipeline.predict_proba(df)[:, 1]
@@ -167,6 +206,58 @@ def predict_df(df: pd.DataFrame, pipeline, meta: Dict[str, Any], threshold: floa
     return out
 
 
+def predict_df(df: pd.DataFrame, pipeline, meta: Dict[str, Any], threshold: float) -> pd.DataFrame:
+    """Prediksi proba & label dengan threshold."""
+    if "label" in df.columns:
+        df = df.drop(columns=["label"])
+    df = ensure_features(df, meta)
+    return _score_engineered(df, pipeline, threshold)
+
+
+def should_dedup(df: pd.DataFrame, min_dup_ratio: float = 0.3, min_rows: int = 5000) -> bool:
+    """Cek apakah batch (fitur rekayasa) layak di-dedup.
+
+    Rasio duplikat dihitung persis lewat `df.duplicated()` (satu kali hash, murah dibanding
+    `predict_proba`). Default diambil dari hasil `deployment/benchmark.py`: di bawah beberapa
+    ribu baris, overhead grouping belum tertutup oleh penghematan scoring.
+    """
+    n = len(df)
+    if n < max(int(min_rows), 1):
+        return False
+    return float(df.duplicated().mean()) >= float(min_dup_ratio)
+
+
+def predict_df_dedup(
+    df: pd.DataFrame, pipeline, meta: Dict[str, Any], threshold: float,
+    min_dup_ratio: float = 0.3, min_rows: int = 5000,
+) -> pd.DataFrame:
+    """Seperti `predict_df`, tapi hanya baris rekayasa yang unik yang di-skor.
+
+    Baris hasil `ensure_features` dikelompokkan berdasarkan nilainya (bukan hash), baris unik
+    di-align & di-skor sekali, lalu hasilnya dipetakan balik ke urutan asli lewat array indeks.
+    Jika `should_dedup` menolak batch, frame langsung di-skor biasa tanpa rekayasa fitur ulang.
+    """
+    if "label" in df.columns:
+        df = df.drop(columns=["label"])
+    df = ensure_features(df, meta)
+    if not should_dedup(df, min_dup_ratio, min_rows):
+        return _score_engineered(df, pipeline, threshold)
+
+    # ngroup(sort=False) memberi kode sesuai urutan kemunculan pertama tiap baris unik
+    codes = df.groupby(list(df.columns), sort=False, dropna=False).ngroup().to_numpy()
+    _, first_idx = np.unique(codes, return_index=True)
+
+    uniq = _score_engineered(df.iloc[first_idx], pipeline, threshold)
+    out = uniq.iloc[codes].copy()
+    out.index = df.index
+    return out
+
+
+def dedup_ratio(n_rows: int, n_unique: int) -> float:
+    """Porsi baris yang tidak perlu di-skor ulang (0 = semua unik)."""
+    return 1.0 - n_unique / n_rows if n_rows else 0.0
+
+
 # ==== Halaman Streamlit (dipanggil dari app.py) ====
 def run():
     st.header("Prediksi Transaksi")